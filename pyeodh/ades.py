@@ -4,7 +4,6 @@ import logging
 from dataclasses import dataclass
 from datetime import datetime as Datetime
 from enum import Enum
-from functools import cached_property
 from typing import TYPE_CHECKING, Any
 
 from pyeodh.eodh_object import EodhObject
@@ -38,6 +37,11 @@ class AdesJobStatus(Enum):
 
 
 class Job(EodhObject):
+    _DATETIME_FIELDS = ("created", "started", "finished", "updated")
+    created: Datetime
+    started: Datetime
+    finished: Datetime
+    updated: Datetime
 
     def __init__(self, client: Client, headers: Headers, data: Any):
         super().__init__(client, headers, data)
@@ -49,31 +53,25 @@ class Job(EodhObject):
         self.status = self._make_str_prop(obj.get("status"))
         self.message = self._make_str_prop(obj.get("message"))
         self.progress = self._make_int_prop(obj.get("progress"))
-        self.links = [Link.from_dict(d) for d in obj.get("links", [])]
-        if "created" in obj:
-            created: str = obj.get("created", "")
-            self.created = Datetime.fromisoformat(created.replace("Z", "+00:00"))
-        if "started" in obj:
-            started: str = obj.get("started", "'")
-            self.started = Datetime.fromisoformat(started.replace("Z", "+00:00"))
-        if "finished" in obj:
-            finished: str = obj.get("finished", "")
-            self.finished = Datetime.fromisoformat(finished.replace("Z", "+00:00"))
-        if "updated" in obj:
-            updated: str = obj.get("updated", "")
-            self.updated = Datetime.fromisoformat(updated.replace("Z", "+00:00"))
-
-    @cached_property
+        self.links = Link.from_dicts(obj.get("links", []))
+        for name in self._DATETIME_FIELDS:
+            value: str | None = obj.get(name)
+            if value is not None:
+                setattr(
+                    self, name, Datetime.fromisoformat(value.replace("Z", "+00:00"))
+                )
+        status_link = Link.get_link(self.links, AdesRelType.STATUS.value)
+        self._self_href = status_link.href if status_link else None
+
+    @property
     def self_href(self) -> str:
-        ln = Link.get_link(self.links, AdesRelType.STATUS.value)
-        if ln is None:
+        if self._self_href is None:
             raise ValueError(f"{self} does not have a link pointing to self")
-        return ln.href
+        return self._self_href
 
     def refresh(self) -> None:
         headers, response = self._client._request_json("GET", self.self_href)
-        if response:
-            self._set_props(response)
+        self._update_props(response)
 
     def delete(self) -> None:
         self._client._request_json_raw("DELETE", self.self_href)
@@ -140,7 +138,7 @@ class Process(EodhObject):
         self.id = self._make_str_prop(obj.get("id"))
         self.title = self._make_str_prop(obj.get("title"))
         self.description = self._make_str_prop(obj.get("description"))
-        self.links = [Link.from_dict(d) for d in obj.get("links", [])]
+        self.links = Link.from_dicts(obj.get("links", []))
         self.version = self._make_str_prop(obj.get("version"))
         self.mutable: bool | None = obj.get("mutable")
         self.job_control_options = self._make_list_of_strs_prop(
@@ -222,8 +220,7 @@ class Process(EodhObject):
             )
 
         headers, response = self._client._request_json("GET", self.self_href)
-        if response:
-            self._set_props(response)
+        self._update_props(response)
 
     def delete(self) -> None:
         self._client._request_json_raw("DELETE", self.self_href)
@@ -236,7 +233,14 @@ class Ades(EodhObject):
 
     def _set_props(self, obj: dict) -> None:
         self._title = self._make_str_prop(obj.get("title"))
-        self.links = [Link.from_dict(d) for d in obj.get("links", [])]
+        self.links = Link.from_dicts(obj.get("links", []))
+        links_by_rel = Link.index(self.links)
+        self_link = Link.get_link(links_by_rel, AdesRelType.SELF.value)
+        processes_link = Link.get_link(links_by_rel, AdesRelType.PROCESSES.value)
+        jobs_link = Link.get_link(links_by_rel, AdesRelType.JOBS.value)
+        self._self_href = self_link.href if self_link else None
+        self._processes_href = processes_link.href if processes_link else None
+        self._jobs_href = jobs_link.href if jobs_link else None
 
     @property
     def title(self) -> str:
@@ -244,26 +248,23 @@ class Ades(EodhObject):
             raise ValueError(f"Property title not set for {self}")
         return self._title
 
-    @cached_property
+    @property
     def self_href(self) -> str:
-        ln = Link.get_link(self.links, AdesRelType.SELF.value)
-        if ln is None:
+        if self._self_href is None:
             raise ValueError(f"{self} does not have a link pointing to self")
-        return ln.href
+        return self._self_href
 
-    @cached_property
+    @property
     def processes_href(self) -> str:
-        ln = Link.get_link(self.links, AdesRelType.PROCESSES.value)
-        if ln is None:
+        if self._processes_href is None:
             raise ValueError(f"{self} does not have a link pointing to processes")
-        return ln.href
+        return self._processes_href
 
-    @cached_property
+    @property
     def jobs_href(self) -> str:
-        ln = Link.get_link(self.links, AdesRelType.JOBS.value)
-        if ln is None:
+        if self._jobs_href is None:
             raise ValueError(f"{self} does not have a link pointing to jobs")
-        return ln.href
+        return self._jobs_href
 
     def get_processes(self) -> list[Process]:
         """Fetches available processes
@@ -274,11 +275,12 @@ class Ades(EodhObject):
             list[Process]: List of available processes.
         """
 
-        headers, response = self._client._request_json("GET", self.processes_href)
+        client, processes_href = self._client, self.processes_href
+        headers, response = client._request_json("GET", processes_href)
         if not response:
             return []
         return [
-            Process(self._client, headers, item, self.processes_href)
+            Process(client, headers, item, processes_href)
             for item in response.get("processes", [])
         ]
 
@@ -357,10 +359,11 @@ class Ades(EodhObject):
             list[Job]: List of user's jobs.
         """
 
-        headers, response = self._client._request_json("GET", self.jobs_href)
+        client = self._client
+        headers, response = client._request_json("GET", self.jobs_href)
         if not response:
             return []
-        return [Job(self._client, headers, item) for item in response.get("jobs", [])]
+        return [Job(client, headers, item) for item in response.get("jobs", [])]
 
     def get_job(self, job_id) -> Job:
         """Fetches an individual job.
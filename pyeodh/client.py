@@ -1,12 +1,17 @@
+import datetime
 import json
 import logging
+import threading
 import urllib.parse
+from collections import OrderedDict
 from typing import Any, Callable
 
 import requests
 from owslib.map import wms111, wms130
 from owslib.wms import WebMapService
 from owslib.wmts import WebMapTileService
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from pyeodh import consts
 from pyeodh.ades import Ades
@@ -14,11 +19,42 @@ from pyeodh.resource_catalog import CatalogService
 from pyeodh.types import Headers, Params, RequestMethod
 from pyeodh.utils import is_absolute_url, join_url
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
-def _encode_json(data: dict) -> tuple[str, str]:
-    return "application/json", json.dumps(data)
+def _json_default(obj: Any) -> Any:
+    if isinstance(obj, (datetime.date, datetime.time)):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _encode_json(data: dict) -> tuple[str, str | bytes]:
+    # Both encoders go through _json_default for dates and accept non-str keys, so
+    # request bodies do not depend on whether orjson is installed
+    if orjson is not None:
+        return "application/json", orjson.dumps(
+            data,
+            default=_json_default,
+            option=orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_PASSTHROUGH_DATETIME
+            | orjson.OPT_PASSTHROUGH_DATACLASS,
+        )
+    return "application/json", json.dumps(data, default=_json_default)
+
+
+def _decode_json(content: bytes) -> Any:
+    if orjson is not None:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            # orjson is strict RFC 8259 and rejects NaN/Infinity, json does not.
+            pass
+    return json.loads(content)
 
 
 class Client:
@@ -30,6 +66,11 @@ class Client:
 
         self.url_base = base_url
         self._build_session()
+        # ETag -> body of recent GET responses, revalidated with If-None-Match
+        self._response_cache: OrderedDict[tuple, tuple[str, Headers, bytes]] = (
+            OrderedDict()
+        )
+        self._response_cache_lock = threading.Lock()
 
         # TEMP:
         if auth:
@@ -38,10 +79,21 @@ class Client:
     def _build_session(
         self,
     ) -> None:
-        # TODO Add retry count, setting auth headers etc. here
+        # TODO Add setting auth headers etc. here
         self._session = requests.Session()
+        # Keep connections alive across calls, the pool has to be large enough for
+        # the concurrent collection fetches
+        adapter = HTTPAdapter(
+            pool_connections=consts.HTTP_POOL_CONNECTIONS,
+            pool_maxsize=consts.HTTP_POOL_MAXSIZE,
+            max_retries=Retry(
+                total=consts.HTTP_RETRIES, backoff_factor=consts.HTTP_RETRY_BACKOFF
+            ),
+        )
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
 
-    def _request_json_raw(
+    def _request(
         self,
         method: RequestMethod,
         url: str,
@@ -49,10 +101,14 @@ class Client:
         params: Params | None = None,
         data: Any | None = None,
         encode: Callable[[Any], tuple[str, Any]] = _encode_json,
-    ) -> tuple[int, Headers, str]:
-        logger.debug(
-            f"_request_json_raw received {locals()}",
-        )
+    ) -> requests.Response:
+        # Formatting request and response bodies is expensive for large payloads,
+        # only do it when the messages are actually emitted
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug(
+                f"_request received {locals()}",
+            )
         if not is_absolute_url(url):
             logger.debug(f"Received not absolute url: {url}")
             url = urllib.parse.urljoin(self.url_base, url)
@@ -65,10 +121,11 @@ class Client:
         encoded_data = None
         if data is not None:
             headers["Content-Type"], encoded_data = encode(data)
-        logger.debug(
-            f"Making request: {method} {url}\nheaders: {headers}\nparams: {params}"
-            f"\nbody: {encoded_data}"
-        )
+        if debug:
+            logger.debug(
+                f"Making request: {method} {url}\nheaders: {headers}\nparams: {params}"
+                f"\nbody: {encoded_data}"
+            )
         response = self._session.request(
             method,
             url,
@@ -76,15 +133,28 @@ class Client:
             params=params,
             data=encoded_data,
         )
-        logger.debug(
-            f"Received response {response.status_code}\nheaders: {response.headers}"
-            f"\ncontent: {response.text}"
-        )
+        if debug:
+            logger.debug(
+                f"Received response {response.status_code}\n"
+                f"headers: {response.headers}\ncontent: {response.text}"
+            )
         # TODO consider moving this to _requst_json() and raise own exceptions
         # so that we can user _raw in e.g. delete methods where we expect a 409 and
         # want to recover
         response.raise_for_status()
 
+        return response
+
+    def _request_json_raw(
+        self,
+        method: RequestMethod,
+        url: str,
+        headers: Headers | None = None,
+        params: Params | None = None,
+        data: Any | None = None,
+        encode: Callable[[Any], tuple[str, Any]] = _encode_json,
+    ) -> tuple[int, Headers, str]:
+        response = self._request(method, url, headers, params, data, encode)
         return response.status_code, response.headers, response.text
 
     def _request_json(
@@ -95,15 +165,50 @@ class Client:
         params: Params | None = None,
         data: Any | None = None,
         encode: Callable[[Any], tuple[str, Any]] = _encode_json,
+        cache: bool = False,
     ) -> tuple[Headers, Any]:
-        status, resp_headers, resp_data = self._request_json_raw(
-            method, url, headers, params, data, encode
-        )
+        # Only small, frequently repeated GETs opt into the cache, paginated
+        # responses are large and rarely requested twice
+        cache_key = None
+        cached = None
+        if cache and method == "GET":
+            cache_key = (
+                url,
+                frozenset(params.items()) if params else None,
+                frozenset(headers.lower_items()) if headers else None,
+            )
+            with self._response_cache_lock:
+                cached = self._response_cache.get(cache_key)
+                if cached is not None:
+                    self._response_cache.move_to_end(cache_key)
+            if cached is not None:
+                headers = Headers() if headers is None else headers.copy()
+                headers["If-None-Match"] = cached[0]
+
+        response = self._request(method, url, headers, params, data, encode)
 
-        if not len(resp_data):
+        if cached is not None and response.status_code == 304:
+            resp_headers, content = cached[1], cached[2]
+        else:
+            resp_headers, content = response.headers, response.content
+            etag = resp_headers.get("ETag")
+            if cache_key is not None and etag:
+                self._cache_response(cache_key, etag, resp_headers, content)
+
+        # Parse the raw bytes, decoding them to text first is an extra pass
+        if not len(content):
             return resp_headers, None
 
-        return resp_headers, json.loads(resp_data)
+        return resp_headers, _decode_json(content)
+
+    def _cache_response(
+        self, key: tuple, etag: str, headers: Headers, content: bytes
+    ) -> None:
+        with self._response_cache_lock:
+            self._response_cache[key] = (etag, headers, content)
+            self._response_cache.move_to_end(key)
+            while len(self._response_cache) > consts.RESPONSE_CACHE_SIZE:
+                self._response_cache.popitem(last=False)
 
     def get_catalog_service(self) -> CatalogService:
         """Initializes the resource catalog API client.
@@ -1,2 +1,7 @@
 API_BASE_URL = "https://test.eodatahub.org.uk"
 PAGINATION_LIMIT = 10
+RESPONSE_CACHE_SIZE = 128
+HTTP_POOL_CONNECTIONS = 16
+HTTP_POOL_MAXSIZE = 32
+HTTP_RETRIES = 3
+HTTP_RETRY_BACKOFF = 0.3
@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import json
 import typing
-from types import NoneType
 from typing import TYPE_CHECKING, Any, Literal, Type, TypeVar
 
 from pystac import STACObject
@@ -18,15 +17,6 @@ T = TypeVar("T")
 T_base = TypeVar("T_base", bound="EodhObject")
 
 
-def is_optional(value: Any, type: Type | tuple[Type, ...]) -> bool:
-    types = ()
-    if isinstance(type, tuple):
-        types = (*type, NoneType)
-    else:
-        types = (type, NoneType)
-    return isinstance(value, types)
-
-
 class EodhObject:
     """Base class for other classes representing objects returned by EODH APIs."""
 
@@ -42,6 +32,7 @@ class EodhObject:
         self._headers = headers
         self._raw_data = data
         self._parent: EodhObject | None = kwargs.get("parent")
+        self._pystac_cls = pystac_cls
 
         if pystac_cls is not None:
             self._pystac_object = pystac_cls.from_dict(data)
@@ -54,6 +45,19 @@ class EodhObject:
             f"Method _set_props not implemented in {self.__class__.__name__}."
         )
 
+    def _update_props(self, data: Any) -> None:
+        """Re-populates properties from an API response. Responses identical to the
+        data the object currently holds are not parsed again."""
+        if not data or data == self._raw_data:
+            return
+        self._raw_data = data
+
+        if self._pystac_cls is not None:
+            self._pystac_object = self._pystac_cls.from_dict(data)
+            self._set_props(self._pystac_object)
+        else:
+            self._set_props(data)
+
     def conforms_to(self, conformance_uri):
         raise NotImplementedError(
             f"Method conforms_to not implemented in {self.__class__.__name__}."
@@ -75,12 +79,13 @@ class EodhObject:
     def _make_prop(value: T, t: Type[T]) -> T:
         if value is None:
             return value
-        if typing.get_origin(t) is Literal and value in typing.get_args(t):
+        # Plain classes are by far the most common, check them before Literal
+        if isinstance(t, type):
+            if isinstance(value, t):
+                return value
+        elif typing.get_origin(t) is Literal and value in typing.get_args(t):
             return value
-        if isinstance(value, t):
-            return value
-        else:
-            raise TypeError(f"Expected {t}, received {value.__class__}.")
+        raise TypeError(f"Expected {t}, received {value.__class__}.")
 
     @staticmethod
     def _make_list_of_type_prop(value: list[T], t: Type[T]) -> list[T]:
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, Generic, Iterator, Type, TypeVar
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Generic, Iterator, Type, TypeVar
 
-from pyeodh import consts
+from pyeodh.consts import PAGINATION_LIMIT
 from pyeodh.eodh_object import EodhObject
 from pyeodh.types import Headers, Params, RequestMethod
 
@@ -29,6 +30,7 @@ class PaginatedList(Generic[T]):
         params: Params | None = None,
         first_data: dict | None = None,
         parent: EodhObject | None = None,
+        prefetch: bool = False,
     ) -> None:
         self._elements: list[T] = []
         self._cls = cls
@@ -41,6 +43,7 @@ class PaginatedList(Generic[T]):
         self._list_key = list_key
         self._data = first_data
         self._parent = parent
+        self._prefetch = prefetch
 
     @property
     def total_count(self):
@@ -71,11 +74,53 @@ class PaginatedList(Generic[T]):
         return self._total_count
 
     def __iter__(self) -> Iterator[T]:
-        yield from self._elements
-        while self._has_next():
-            new_elements = self._fetch_next()
-            self._elements += new_elements
-            yield from new_elements
+        if self._prefetch:
+            yield from self._iter_prefetched()
+            return
+        # Walk the cached elements by position, pages fetched by indexing between
+        # two iteration steps are yielded rather than skipped
+        index = 0
+        while True:
+            while index < len(self._elements):
+                yield self._elements[index]
+                index += 1
+            if not self._has_next():
+                return
+            self._elements += self._fetch_next()
+
+    def _iter_prefetched(self) -> Iterator[T]:
+        # Request the next page in the background while the current one is being
+        # consumed, so the round-trip overlaps with the caller's processing. The
+        # worker only performs the request, the cursor and the cached elements are
+        # updated here, so a page in flight when iteration stops is never lost.
+        executor = ThreadPoolExecutor(max_workers=1)
+        pending: tuple[str | None, dict | None, Future] | None = None
+        index = 0
+        try:
+            while True:
+                while index < len(self._elements):
+                    yield self._elements[index]
+                    index += 1
+                if not self._has_next():
+                    return
+                cursor = (self._next_url, self._data)
+                # Drop the prefetched page if the cursor moved on in the meantime,
+                # e.g. by indexing into the list between two iteration steps
+                if pending is not None and pending[:2] != cursor:
+                    pending[2].cancel()
+                    pending = None
+                if pending is None:
+                    pending = (*cursor, executor.submit(self._request_page, *cursor))
+                headers, resp_data = pending[2].result()
+                pending = None
+                self._elements += self._parse_page(headers, resp_data)
+                if self._has_next():
+                    cursor = (self._next_url, self._data)
+                    pending = (*cursor, executor.submit(self._request_page, *cursor))
+        finally:
+            if pending is not None:
+                pending[2].cancel()
+            executor.shutdown(wait=False)
 
     def __getitem__(self, index: int) -> T:
         assert isinstance(index, int)
@@ -91,15 +136,21 @@ class PaginatedList(Generic[T]):
         return self._next_url is not None
 
     def _fetch_next(self) -> list[T]:
-        if not self._next_url:
+        return self._parse_page(*self._request_page(self._next_url, self._data))
+
+    def _request_page(self, url: str | None, data: dict | None) -> tuple[Headers, Any]:
+        # Doesn't touch the cursor, safe to run in the prefetch worker
+        if not url:
             raise RuntimeError("Next url not specified!")
-        headers, resp_data = self._client._request_json(
+        return self._client._request_json(
             self._method,
-            self._next_url,
+            url,
             headers=self._headers,
             params=self._params,
-            data=self._data,
+            data=data,
         )
+
+    def _parse_page(self, headers: Headers, resp_data: Any) -> list[T]:
         next_link = next(
             filter(lambda ln: ln.get("rel") == "next", resp_data.get("links", {})), {}
         )
@@ -112,13 +163,9 @@ class PaginatedList(Generic[T]):
         if self._list_key in resp_data:
             resp_data = resp_data[self._list_key]
 
+        cls, client, parent = self._cls, self._client, self._parent
         return [
-            self._cls(
-                self._client,
-                headers,
-                element,
-                parent=self._parent,
-            )
+            cls(client, headers, element, parent=parent)
             for element in resp_data
             if element is not None
         ]
@@ -130,7 +177,7 @@ class PaginatedList(Generic[T]):
             list[T]: List of objects
         """
 
-        limit = consts.PAGINATION_LIMIT
+        limit = PAGINATION_LIMIT
         if self._data:
             limit: int = self._data.get("per_page", limit)
 
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
-from functools import cached_property
 from typing import TYPE_CHECKING, Any, Literal, TypeVar
 
 import pystac
@@ -11,11 +12,11 @@ from pystac import Extent, RelType, STACObject, STACTypeError, Summaries
 from pystac.asset import Asset
 from pystac.provider import Provider
 
-from pyeodh import consts
-from pyeodh.eodh_object import EodhObject, is_optional
+from pyeodh.consts import PAGINATION_LIMIT
+from pyeodh.eodh_object import EodhObject
 from pyeodh.pagination import PaginatedList
 from pyeodh.types import Headers, SearchFields, SearchSortField
-from pyeodh.utils import ConformanceError, join_url, remove_null_items
+from pyeodh.utils import ConformanceError, build_payload, join_url
 
 if TYPE_CHECKING:
     # avoids conflicts since there are also kwargs and attrs called `datetime`
@@ -25,6 +26,63 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Argument type checks are skipped by default, the API validates request bodies anyway
+_VALIDATE = os.getenv("PYEODH_VALIDATE", "").lower() in ["yes", "true", "on", "1"]
+
+_COLLECTION_SCHEMA: dict[str, type | tuple[type, ...]] = {
+    "description": str,
+    "extent": Extent,
+    "title": str,
+    "license": str,
+    "keywords": list,
+    "providers": list,
+    "summaries": Summaries,
+    "assets": dict,
+}
+_CREATE_COLLECTION_SCHEMA = {"id": str, **_COLLECTION_SCHEMA}
+_CATALOG_SCHEMA: dict[str, type | tuple[type, ...]] = {
+    "description": str,
+    "title": str,
+}
+_CREATE_CATALOG_SCHEMA = {"id": str, **_CATALOG_SCHEMA}
+_SEARCH_SCHEMA: dict[str, type | tuple[type, ...]] = {
+    "limit": int,
+    "collections": list,
+    "catalog_paths": list,
+    "ids": list,
+    "bbox": list,
+    "datetime": str,
+    "fields": dict,
+    "query": (dict, list),
+    "sort_by": list,
+    "filter": dict,
+    "filter_crs": str,
+}
+_COLLECTION_SEARCH_SCHEMA: dict[str, type | tuple[type, ...]] = {
+    "limit": int,
+    "bbox": list,
+    "datetime": str,
+    "query": str,
+}
+_DISCOVERY_SEARCH_SCHEMA: dict[str, type | tuple[type, ...]] = {
+    "query": str,
+    "limit": int,
+}
+
+
+def _validate_args(
+    schema: dict[str, type | tuple[type, ...]],
+    required: tuple[str, ...] = (),
+    /,
+    **values: Any,
+) -> None:
+    for name, t in schema.items():
+        value = values[name]
+        if name in required:
+            assert isinstance(value, t), value
+        else:
+            assert value is None or isinstance(value, t), value
+
 
 C = TypeVar("C", bound="STACObject")
 
@@ -49,6 +107,14 @@ class Item(EodhObject):
         self.properties = obj.properties
         self.collection = obj.collection_id
         self.assets = obj.assets
+        self_link = obj.get_single_link(RelType.SELF)
+        self._self_href = self_link.get_target_str() if self_link else None
+
+    @property
+    def self_href(self) -> str:
+        if self._self_href is None:
+            raise ValueError(f"{self} does not have a link pointing to self")
+        return self._self_href
 
     def delete(self) -> None:
         """Delete this item.
@@ -60,7 +126,7 @@ class Item(EodhObject):
             raise ConformanceError(
                 f"{Conformance.TRANSACTION_EXTENSION.value}",
             )
-        self._client._request_json_raw("DELETE", self._pystac_object.self_href)
+        self._client._request_json_raw("DELETE", self.self_href)
 
     def update(
         self,
@@ -91,24 +157,20 @@ class Item(EodhObject):
                 f"{Conformance.TRANSACTION_EXTENSION.value}",
             )
 
-        put_data = remove_null_items(
-            {
-                "id": self.id,
-                "geometry": geometry or self.geometry,  # ! getting 500 with this
-                "bbox": bbox or self.bbox,
-                "datetime": datetime or self.datetime,
-                "properties": properties or self.properties,
-                "collection": collection or self.collection,
-                "assets": assets or self.assets,
-            }
+        put_data = build_payload(
+            id=self.id,
+            # ! getting 500 with geometry
+            geometry=geometry if geometry is not None else self.geometry,
+            bbox=bbox if bbox is not None else self.bbox,
+            datetime=datetime if datetime is not None else self.datetime,
+            properties=properties if properties is not None else self.properties,
+            collection=collection if collection is not None else self.collection,
+            assets=assets if assets is not None else self.assets,
         )
 
-        _, resp_data = self._client._request_json(
-            "PUT", self._pystac_object.self_href, data=put_data
-        )
+        _, resp_data = self._client._request_json("PUT", self.self_href, data=put_data)
 
-        if resp_data:
-            self._set_props(self._pystac_object.from_dict(resp_data))
+        self._update_props(resp_data)
 
 
 class Collection(EodhObject):
@@ -127,13 +189,22 @@ class Collection(EodhObject):
         self.providers = obj.providers
         self.summaries = obj.summaries
         self.assets = obj.assets
-
-    @cached_property
+        self_link = obj.get_single_link(RelType.SELF)
+        self._self_href = self_link.get_target_str() if self_link else None
+        items_link = obj.get_single_link(RelType.ITEMS)
+        self._items_href = items_link.get_target_str() if items_link else None
+
+    @property
+    def self_href(self) -> str:
+        if self._self_href is None:
+            raise ValueError(f"{self} does not have a link pointing to self")
+        return self._self_href
+
+    @property
     def items_href(self) -> str:
-        link = self._pystac_object.get_single_link(RelType.ITEMS)
-        if not link:
+        if self._items_href is None:
             raise RuntimeError("Object does not have items link!")
-        return link.href
+        return self._items_href
 
     def get_items(self) -> PaginatedList[Item]:
         """Fetches all items within a collection.
@@ -144,14 +215,18 @@ class Collection(EodhObject):
             PaginatedList[Item]: Iterable list of items. Automatically handles
                 paginated results.
         """
+        return self._get_items(prefetch=True)
+
+    def _get_items(self, prefetch: bool) -> PaginatedList[Item]:
         return PaginatedList(
             Item,
             self._client,
             "GET",
             self.items_href,
             "features",
-            params={"limit": consts.PAGINATION_LIMIT},
+            params={"limit": PAGINATION_LIMIT},
             parent=self,
+            prefetch=prefetch,
         )
 
     def get_item(self, item_id: str) -> Item:
@@ -201,35 +276,34 @@ class Collection(EodhObject):
             raise ConformanceError(
                 f"{Conformance.TRANSACTION_EXTENSION.value}",
             )
-        assert is_optional(description, str), description
-        assert is_optional(extent, Extent), extent
-        assert is_optional(title, str), title
-        assert is_optional(license, str), license
-        assert is_optional(keywords, list), keywords
-        assert is_optional(providers, list), providers
-        assert is_optional(summaries, Summaries), summaries
-        assert is_optional(assets, dict), assets
-
-        put_data = remove_null_items(
-            {
-                "id": self.id,
-                "description": description or self.description,
-                "extent": extent or self.extent,
-                "title": title or self.title,
-                "license": license or self.license,
-                "keywords": keywords or self.keywords,
-                "providers": providers or self.providers,
-                "summaries": summaries or self.summaries,
-                "assets": assets or self.assets,
-            }
-        )
+        if __debug__ and _VALIDATE:
+            _validate_args(
+                _COLLECTION_SCHEMA,
+                description=description,
+                extent=extent,
+                title=title,
+                license=license,
+                keywords=keywords,
+                providers=providers,
+                summaries=summaries,
+                assets=assets,
+            )
 
-        _, resp_data = self._client._request_json(
-            "PUT", self._pystac_object.self_href, data=put_data
+        put_data = build_payload(
+            id=self.id,
+            description=description if description is not None else self.description,
+            extent=extent if extent is not None else self.extent,
+            title=title if title is not None else self.title,
+            license=license if license is not None else self.license,
+            keywords=keywords if keywords is not None else self.keywords,
+            providers=providers if providers is not None else self.providers,
+            summaries=summaries if summaries is not None else self.summaries,
+            assets=assets if assets is not None else self.assets,
         )
 
-        if resp_data:
-            self._set_props(self._pystac_object.from_dict(resp_data))
+        _, resp_data = self._client._request_json("PUT", self.self_href, data=put_data)
+
+        self._update_props(resp_data)
 
     def delete(self) -> None:
         """Delete this collection.
@@ -240,7 +314,7 @@ class Collection(EodhObject):
             raise ConformanceError(
                 f"{Conformance.TRANSACTION_EXTENSION.value}",
             )
-        self._client._request_json_raw("DELETE", self._pystac_object.self_href)
+        self._client._request_json_raw("DELETE", self.self_href)
 
     def create_item(
         self,
@@ -273,16 +347,14 @@ class Collection(EodhObject):
             raise ConformanceError(
                 f"{Conformance.TRANSACTION_EXTENSION.value}",
             )
-        post_data = remove_null_items(
-            {
-                "id": id,
-                "geometry": geometry,
-                "bbox": bbox,
-                "datetime": datetime,
-                "properties": properties,
-                "collection": collection,
-                "assets": assets,
-            }
+        post_data = build_payload(
+            id=id,
+            geometry=geometry,
+            bbox=bbox,
+            datetime=datetime,
+            properties=properties,
+            collection=collection,
+            assets=assets,
         )
 
         headers, response = self._client._request_json(
@@ -301,10 +373,23 @@ class Catalog(EodhObject):
         self.id = obj.id
         self.description = obj.description
         self.title = obj.title
+        self_link = obj.get_single_link(RelType.SELF)
+        self._self_href = self_link.get_target_str() if self_link else None
+        self._collections_href = (
+            join_url(self._self_href, "collections") if self._self_href else None
+        )
 
-    @cached_property
+    @property
+    def self_href(self) -> str:
+        if self._self_href is None:
+            raise ValueError(f"{self} does not have a link pointing to self")
+        return self._self_href
+
+    @property
     def collections_href(self) -> str:
-        return join_url(self._pystac_object.self_href, "collections")
+        if self._collections_href is None:
+            raise ValueError(f"{self} does not have a link pointing to self")
+        return self._collections_href
 
     def get_catalogs(self) -> list[Catalog]:
         """Fetches children catalogs of this parent catalog.
@@ -314,7 +399,7 @@ class Catalog(EodhObject):
         Returns:
             list[Catalog]: List of children catalogs.
         """
-        url = join_url(self._pystac_object.self_href, "catalogs")
+        url = join_url(self.self_href, "catalogs")
         headers, data = self._client._request_json("GET", url)
         catalogs = []
 
@@ -334,14 +419,39 @@ class Catalog(EodhObject):
             list[Collection]: List of available collections
         """
 
-        headers, response = self._client._request_json("GET", self.collections_href)
+        client = self._client
+        headers, response = client._request_json("GET", self.collections_href)
         if not response:
             return []
         return [
-            Collection(self._client, headers, item, parent=self)
+            Collection(client, headers, item, parent=self)
             for item in response.get("collections", [])
         ]
 
+    def get_all_items(self, max_workers: int = 16) -> dict[str, list[Item]]:
+        """Fetches all items of every collection in this catalog. Collections are
+        fetched concurrently.
+
+        Calls: GET /catalogs/{catalog_id}/collections
+        Calls: GET /catalogs/{catalog_id}/collections/{collection_id}/items
+
+        Args:
+            max_workers (int, optional): Maximum number of collections fetched at the
+                same time, which is also the maximum number of requests in flight.
+                Defaults to 16.
+
+        Returns:
+            dict[str, list[Item]]: Items keyed by ID of their collection.
+        """
+        collections = self.get_collections()
+        # Pages are not prefetched within a collection, the workers already overlap
+        # requests and a prefetch thread each would double the open connections
+        with ThreadPoolExecutor(max_workers) as executor:
+            items = executor.map(
+                lambda c: list(c._get_items(prefetch=False)), collections
+            )
+            return dict(zip([c.id for c in collections], items))
+
     def get_collection(self, collection_id: str) -> Collection:
         """Fetches a resource catalog collection.
 
@@ -354,10 +464,29 @@ class Catalog(EodhObject):
             Collection: Collection for given ID
         """
         url = join_url(self.collections_href, collection_id)
-        headers, response = self._client._request_json("GET", url)
+        headers, response = self._client._request_json("GET", url, cache=True)
 
         return Collection(self._client, headers, response, parent=self)
 
+    def get_collections_by_ids(
+        self, ids: list[str], max_workers: int = 16
+    ) -> list[Collection]:
+        """Fetches multiple resource catalog collections. Collections are fetched
+        concurrently.
+
+        Calls: GET /catalogs/{catalog_id}/collections/{collection_id}
+
+        Args:
+            ids (list[str]): IDs of collections
+            max_workers (int, optional): Maximum number of collections fetched at the
+                same time. Defaults to 16.
+
+        Returns:
+            list[Collection]: Collections in the same order as `ids`
+        """
+        with ThreadPoolExecutor(max_workers) as executor:
+            return list(executor.map(self.get_collection, ids))
+
     def create_collection(
         self,
         id: str,
@@ -392,28 +521,31 @@ class Catalog(EodhObject):
             raise ConformanceError(
                 f"{Conformance.TRANSACTION_EXTENSION.value}",
             )
-        assert isinstance(id, str), id
-        assert isinstance(description, str), description
-        assert isinstance(extent, Extent), extent
-        assert is_optional(title, str), title
-        assert is_optional(license, str), license
-        assert is_optional(keywords, list), keywords
-        assert is_optional(providers, list), providers
-        assert is_optional(summaries, Summaries), summaries
-        assert is_optional(assets, dict), assets
-
-        post_data = remove_null_items(
-            {
-                "id": id,
-                "description": description,
-                "extent": extent,
-                "title": title,
-                "license": license,
-                "keywords": keywords,
-                "providers": providers,
-                "summaries": summaries,
-                "assets": assets,
-            }
+        if __debug__ and _VALIDATE:
+            _validate_args(
+                _CREATE_COLLECTION_SCHEMA,
+                ("id", "description", "extent"),
+                id=id,
+                description=description,
+                extent=extent,
+                title=title,
+                license=license,
+                keywords=keywords,
+                providers=providers,
+                summaries=summaries,
+                assets=assets,
+            )
+
+        post_data = build_payload(
+            id=id,
+            description=description,
+            extent=extent,
+            title=title,
+            license=license,
+            keywords=keywords,
+            providers=providers,
+            summaries=summaries,
+            assets=assets,
         )
         headers, response = self._client._request_json(
             "POST", self.collections_href, data=post_data
@@ -437,22 +569,21 @@ class Catalog(EodhObject):
             raise ConformanceError(
                 f"{Conformance.TRANSACTION_EXTENSION.value}",
             )
-        assert is_optional(description, str), description
-        assert is_optional(title, str), title
-
-        put_data = remove_null_items(
-            {
-                "id": self.id,
-                "description": description or self.description,
-                "title": title or self.title,
-            }
-        )
-        _, resp_data = self._client._request_json(
-            "PUT", self._pystac_object.self_href, data=put_data
+        if __debug__ and _VALIDATE:
+            _validate_args(
+                _CATALOG_SCHEMA,
+                description=description,
+                title=title,
+            )
+
+        put_data = build_payload(
+            id=self.id,
+            description=description if description is not None else self.description,
+            title=title if title is not None else self.title,
         )
+        _, resp_data = self._client._request_json("PUT", self.self_href, data=put_data)
 
-        if resp_data:
-            self._set_props(self._pystac_object.from_dict(resp_data))
+        self._update_props(resp_data)
 
     def delete(self) -> None:
         """Delete this catalog.
@@ -463,11 +594,11 @@ class Catalog(EodhObject):
             raise ConformanceError(
                 f"{Conformance.TRANSACTION_EXTENSION.value}",
             )
-        self._client._request_json_raw("DELETE", self._pystac_object.self_href)
+        self._client._request_json_raw("DELETE", self.self_href)
 
     def search(
         self,
-        limit: int = consts.PAGINATION_LIMIT,
+        limit: int = PAGINATION_LIMIT,
         collections: list[str] | None = None,
         catalog_paths: list[str] | None = None,
         ids: list[str] | None = None,
@@ -481,40 +612,49 @@ class Catalog(EodhObject):
         filter_crs: str | None = None,
         filter_lang: Literal["cql-json", "cql2-json", "cql2-text"] | None = None,
     ) -> PaginatedList[Item]:
-        assert isinstance(limit, int), limit
-        assert is_optional(collections, list), collections
-        assert is_optional(catalog_paths, list), catalog_paths
-        assert is_optional(ids, list), ids
-        assert is_optional(bbox, list), bbox
-        # assert is_optional(intersects, dict), intersects
-        assert is_optional(datetime, str), datetime
-        assert is_optional(fields, dict), fields
-        assert is_optional(query, (dict, list)), query
-        assert is_optional(sort_by, list), sort_by
-        assert is_optional(filter, dict), filter
-        assert is_optional(filter_crs, str), filter_crs
-        assert filter_lang in ["cql-json", "cql2-json", "cql2-text", None]
-
-        data = remove_null_items(
-            {
-                "limit": limit,
-                "catalog_paths": catalog_paths,
-                "collections": collections,
-                "ids": ids,
-                "bbox": bbox,
-                "intersects": self._format_intersects(intersects),
-                "datetime": datetime,
-                "fields": fields,
-                "query": self._make_query_dict(query),
-                "sortby": sort_by,
-                "filter": filter,
-                "filter_crs": filter_crs,
-                "filter_lang": filter_lang,
-            }
+        if __debug__ and _VALIDATE:
+            _validate_args(
+                _SEARCH_SCHEMA,
+                ("limit",),
+                limit=limit,
+                collections=collections,
+                catalog_paths=catalog_paths,
+                ids=ids,
+                bbox=bbox,
+                datetime=datetime,
+                fields=fields,
+                query=query,
+                sort_by=sort_by,
+                filter=filter,
+                filter_crs=filter_crs,
+            )
+            assert filter_lang in ["cql-json", "cql2-json", "cql2-text", None]
+
+        data = build_payload(
+            limit=limit,
+            catalog_paths=catalog_paths,
+            collections=collections,
+            ids=ids,
+            bbox=bbox,
+            intersects=self._format_intersects(intersects),
+            datetime=datetime,
+            fields=fields,
+            query=self._make_query_dict(query),
+            sortby=sort_by,
+            filter=filter,
+            filter_crs=filter_crs,
+            filter_lang=filter_lang,
         )
-        url = join_url(self._pystac_object.self_href, "search")
+        url = join_url(self.self_href, "search")
         return PaginatedList(
-            Item, self._client, "POST", url, "features", first_data=data, parent=self
+            Item,
+            self._client,
+            "POST",
+            url,
+            "features",
+            first_data=data,
+            parent=self,
+            prefetch=True,
         )
 
 
@@ -542,7 +682,7 @@ class CatalogService(Catalog):
             Catalog: An initialized resource catalog object.
         """
 
-        url = join_url(self._pystac_object.self_href, "catalogs", catalog_id)
+        url = join_url(self.self_href, "catalogs", catalog_id)
         headers, data = self._client._request_json("GET", url)
         return Catalog(self._client, headers, data, parent=self)
 
@@ -578,16 +718,19 @@ class CatalogService(Catalog):
             raise ConformanceError(
                 f"{Conformance.TRANSACTION_EXTENSION.value}",
             )
-        assert isinstance(id, str), id
-        assert isinstance(description, str), description
-        assert is_optional(title, str), title
-
-        post_data = remove_null_items(
-            {
-                "id": id,
-                "description": description,
-                "title": title,
-            }
+        if __debug__ and _VALIDATE:
+            _validate_args(
+                _CREATE_CATALOG_SCHEMA,
+                ("id", "description"),
+                id=id,
+                description=description,
+                title=title,
+            )
+
+        post_data = build_payload(
+            id=id,
+            description=description,
+            title=title,
         )
         headers, response = self._client._request_json(
             "POST", self.collections_href, data=post_data
@@ -596,7 +739,7 @@ class CatalogService(Catalog):
 
     def collection_search(
         self,
-        limit: int = consts.PAGINATION_LIMIT,
+        limit: int = PAGINATION_LIMIT,
         bbox: list[Any] | None = None,
         datetime: str | None = None,
         query: str | None = None,
@@ -605,7 +748,7 @@ class CatalogService(Catalog):
 
         Args:
             limit (int, optional): Number of results per page. Defaults to
-                consts.PAGINATION_LIMIT.
+                PAGINATION_LIMIT.
             bbox (list[Any] | None, optional): Bounding box. Defaults to None.
             datetime (str | None, optional): Datetime. Defaults to None.
             query (str | None, optional): Query string. Defaults to None.
@@ -614,20 +757,23 @@ class CatalogService(Catalog):
             PaginatedList[Collection]: Iterable list of collections.
         """
 
-        assert isinstance(limit, int), limit
-        assert is_optional(bbox, list), bbox
-        assert is_optional(datetime, str), datetime
-        assert is_optional(query, str), query
-
-        data = remove_null_items(
-            {
-                "limit": limit,
-                "bbox": bbox,
-                "datetime": datetime,
-                "q": query,
-            }
+        if __debug__ and _VALIDATE:
+            _validate_args(
+                _COLLECTION_SEARCH_SCHEMA,
+                ("limit",),
+                limit=limit,
+                bbox=bbox,
+                datetime=datetime,
+                query=query,
+            )
+
+        data = build_payload(
+            limit=limit,
+            bbox=bbox,
+            datetime=datetime,
+            q=query,
         )
-        url = join_url(self._pystac_object.self_href, "collection-search")
+        url = join_url(self.self_href, "collection-search")
         return PaginatedList(
             Collection,
             self._client,
@@ -641,29 +787,32 @@ class CatalogService(Catalog):
     def discovery_search(
         self,
         query: str,
-        limit: int = consts.PAGINATION_LIMIT,
+        limit: int = PAGINATION_LIMIT,
     ) -> PaginatedList[Catalog]:
         """Searches the catalog for catalogs and collections.
 
         Args:
             limit (int, optional): Number of results per page. Defaults to
-                consts.PAGINATION_LIMIT.
+                PAGINATION_LIMIT.
             query (str | None, optional): Query string. Defaults to None.
 
         Returns:
             PaginatedList[Collection]: Iterable list of collections.
         """
 
-        assert isinstance(query, str), query
-        assert isinstance(limit, int), limit
+        if __debug__ and _VALIDATE:
+            _validate_args(
+                _DISCOVERY_SEARCH_SCHEMA,
+                ("query", "limit"),
+                query=query,
+                limit=limit,
+            )
 
-        data = remove_null_items(
-            {
-                "limit": limit,
-                "q": query,
-            }
+        data = build_payload(
+            limit=limit,
+            q=query,
         )
-        url = join_url(self._pystac_object.self_href, "discovery-search")
+        url = join_url(self.self_href, "discovery-search")
 
         return PaginatedList(
             Catalog,
@@ -683,8 +832,8 @@ class CatalogService(Catalog):
         Returns:
             list[str]: Standards.
         """
-        url = join_url(self._pystac_object.self_href, "conformance")
-        _, response = self._client._request_json("GET", url)
+        url = join_url(self.self_href, "conformance")
+        _, response = self._client._request_json("GET", url, cache=True)
         return response.get("conformsTo", [])
 
     def ping(self) -> str | None:
@@ -696,7 +845,7 @@ class CatalogService(Catalog):
             str | None: Pong.
         """
         headers, response = self._client._request_json(
-            "GET", join_url(self._pystac_object.self_href, "_mgmt/ping")
+            "GET", join_url(self.self_href, "_mgmt/ping"), cache=True
         )
         return response.get("message")
 
@@ -21,7 +21,7 @@ class SearchFields(TypedDict):
 L = TypeVar("L", bound="Link")
 
 
-@dataclass
+@dataclass(slots=True)
 class Link:
     rel: str
     href: str
@@ -37,6 +37,17 @@ class Link:
             media_type=data.get("type", None),
         )
 
+    @classmethod
+    def from_dicts(cls: Type[L], data: list[dict[str, str]]) -> list[L]:
+        return [cls(d["rel"], d["href"], d.get("title"), d.get("type")) for d in data]
+
+    @staticmethod
+    def index(links: list[L]) -> dict[str, L]:
+        # Reversed so that the first link of each rel wins, same as get_link
+        return {ln.rel: ln for ln in reversed(links)}
+
     @staticmethod
-    def get_link(links: list[L], rel: str) -> L | None:
+    def get_link(links: list[L] | dict[str, L], rel: str) -> L | None:
+        if isinstance(links, dict):
+            return links.get(rel)
         return next((ln for ln in links if rel == ln.rel), None)
@@ -1,25 +1,31 @@
-import posixpath
-import urllib.parse
 from typing import Any
 
+_ABSOLUTE_URL_PREFIXES = ("http://", "https://")
+
 
 def is_absolute_url(url: str) -> bool:
-    return bool(urllib.parse.urlparse(url).netloc)
+    # Schemes are case-insensitive; scheme-relative URLs ("//host/path") count as
+    # relative and are resolved against the client's base URL
+    return url[:8].lower().startswith(_ABSOLUTE_URL_PREFIXES)
 
 
 def join_url(*args: str) -> str:
-    for a in args[1:]:
+    url, *parts = args
+    for a in parts:
         if a.startswith("/"):
             raise ValueError(
                 f"Argument {a} is an absolute path! "
-                "Only the first argument can start with '/'. "
-                "See posixpath.join() documentation."
+                "Only the first argument can start with '/'."
             )
-    return posixpath.join(*args)
+        if not url or url.endswith("/"):
+            url += a
+        else:
+            url += "/" + a
+    return url
 
 
-def remove_null_items(d: dict[str, Any]) -> dict[str, Any]:
-    return {k: v for k, v in d.items() if v is not None}
+def build_payload(**kwargs: Any) -> dict[str, Any]:
+    return {k: v for k, v in kwargs.items() if v is not None}
 
 
 class ConformanceError(Exception):
@@ -0,0 +1,139 @@
+import json
+import math
+from datetime import date, datetime, timezone
+from unittest.mock import Mock
+
+import pytest
+
+from pyeodh import client
+from pyeodh.types import Headers
+
+BASE_URL = "https://example.com"
+
+
+@pytest.mark.parametrize(
+    "use_orjson",
+    [
+        False,
+        pytest.param(
+            True,
+            marks=pytest.mark.skipif(
+                client.orjson is None, reason="orjson not installed"
+            ),
+        ),
+    ],
+)
+def test_encode_json(monkeypatch: pytest.MonkeyPatch, use_orjson: bool) -> None:
+    """Tests request bodies encode the same with and without orjson."""
+    if not use_orjson:
+        monkeypatch.setattr(client, "orjson", None)
+    data = {
+        "datetime": datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+        "date": date(2024, 1, 2),
+        1: "a",
+    }
+
+    content_type, body = client._encode_json(data)
+
+    assert content_type == "application/json"
+    assert json.loads(body) == {
+        "datetime": "2024-01-02T03:04:05+00:00",
+        "date": "2024-01-02",
+        "1": "a",
+    }
+
+
+def test_encode_json_unsupported_type(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Tests objects neither encoder knows about are rejected."""
+    monkeypatch.setattr(client, "orjson", None)
+    with pytest.raises(TypeError):
+        client._encode_json({"value": object()})
+
+
+@pytest.mark.parametrize(
+    "use_orjson",
+    [
+        False,
+        pytest.param(
+            True,
+            marks=pytest.mark.skipif(
+                client.orjson is None, reason="orjson not installed"
+            ),
+        ),
+    ],
+)
+def test_decode_json_non_finite(
+    monkeypatch: pytest.MonkeyPatch, use_orjson: bool
+) -> None:
+    """Tests NaN and Infinity decode the same with and without orjson."""
+    if not use_orjson:
+        monkeypatch.setattr(client, "orjson", None)
+
+    data = client._decode_json(b'{"nodata": NaN, "max": Infinity}')
+
+    assert math.isnan(data["nodata"])
+    assert data["max"] == math.inf
+
+
+def _response(status_code: int, content: bytes = b"", etag: str | None = None):
+    headers = Headers({"ETag": etag} if etag else {})
+    return Mock(status_code=status_code, content=content, headers=headers, text="")
+
+
+@pytest.fixture
+def mock_client() -> tuple[client.Client, Mock]:
+    c = client.Client(BASE_URL)
+    session = Mock()
+    c._session = session
+    return c, session
+
+
+def test_request_json_cache_revalidates(
+    mock_client: tuple[client.Client, Mock],
+) -> None:
+    """Tests a cached GET sends If-None-Match and reuses the body on a 304."""
+    c, session = mock_client
+    session.request.side_effect = [
+        _response(200, b'{"id": "a"}', '"v1"'),
+        _response(304),
+    ]
+
+    first = c._request_json("GET", "/collections/a", cache=True)
+    second = c._request_json("GET", "/collections/a", cache=True)
+
+    assert first[1] == second[1] == {"id": "a"}
+    assert second[0]["ETag"] == '"v1"'
+    first_call, second_call = session.request.call_args_list
+    assert "If-None-Match" not in first_call.kwargs["headers"]
+    assert second_call.kwargs["headers"]["If-None-Match"] == '"v1"'
+
+
+def test_request_json_cache_opt_in(mock_client: tuple[client.Client, Mock]) -> None:
+    """Tests GETs are not cached unless requested."""
+    c, session = mock_client
+    session.request.return_value = _response(200, b'{"id": "a"}', '"v1"')
+
+    c._request_json("GET", "/collections/a")
+    c._request_json("GET", "/collections/a")
+
+    assert not c._response_cache
+    assert "If-None-Match" not in session.request.call_args.kwargs["headers"]
+
+
+def test_request_json_cache_eviction(
+    monkeypatch: pytest.MonkeyPatch, mock_client: tuple[client.Client, Mock]
+) -> None:
+    """Tests the least recently used response is evicted when the cache is full."""
+    monkeypatch.setattr(client.consts, "RESPONSE_CACHE_SIZE", 2)
+    c, session = mock_client
+    session.request.side_effect = lambda method, url, **kwargs: _response(
+        200, b"{}", f'"{url}"'
+    )
+
+    for name in ["a", "b", "a", "c"]:
+        c._request_json("GET", f"/collections/{name}", cache=True)
+
+    assert [key[0] for key in c._response_cache] == [
+        "/collections/a",
+        "/collections/c",
+    ]
@@ -0,0 +1,70 @@
+from itertools import islice
+from unittest.mock import Mock
+
+import pytest
+
+from pyeodh.eodh_object import EodhObject
+from pyeodh.pagination import PaginatedList
+
+PAGES = 5
+PAGE_SIZE = 10
+BASE_URL = "https://api.example.com/items"
+
+
+class DummyItem(EodhObject):
+    def _set_props(self, obj: dict) -> None:
+        self.id = obj["id"]
+
+
+def _page(page: int) -> tuple[dict, dict]:
+    links = []
+    if page + 1 < PAGES:
+        links.append({"rel": "next", "href": f"{BASE_URL}?page={page + 1}"})
+    items = [{"id": page * PAGE_SIZE + i} for i in range(PAGE_SIZE)]
+    return {}, {"items": items, "links": links}
+
+
+@pytest.fixture
+def mock_client() -> Mock:
+    client = Mock()
+
+    def request_json(method, url, headers=None, params=None, data=None):
+        page = int(url.rpartition("=")[2]) if "=" in url else 0
+        return _page(page)
+
+    client._request_json.side_effect = request_json
+    return client
+
+
+@pytest.fixture(params=[False, True], ids=["sequential", "prefetch"])
+def paginated_list(request, mock_client: Mock) -> PaginatedList[DummyItem]:
+    return PaginatedList(
+        DummyItem, mock_client, "GET", BASE_URL, "items", prefetch=request.param
+    )
+
+
+def test_iter(paginated_list: PaginatedList[DummyItem]) -> None:
+    """Tests iterating fetches every page exactly once, in order."""
+    assert [item.id for item in paginated_list] == list(range(PAGES * PAGE_SIZE))
+    assert [item.id for item in paginated_list] == list(range(PAGES * PAGE_SIZE))
+
+
+def test_iter_early_break(paginated_list: PaginatedList[DummyItem]) -> None:
+    """Tests stopping iteration early does not skip pages on the next pass."""
+    assert [item.id for item in islice(paginated_list, 2)] == [0, 1]
+    for item in paginated_list:
+        if item.id == PAGE_SIZE + 1:
+            break
+
+    assert [item.id for item in paginated_list] == list(range(PAGES * PAGE_SIZE))
+    assert paginated_list[PAGES * PAGE_SIZE - 1].id == PAGES * PAGE_SIZE - 1
+
+
+def test_iter_interleaved_getitem(paginated_list: PaginatedList[DummyItem]) -> None:
+    """Tests indexing while iterating neither duplicates nor drops elements."""
+    it = iter(paginated_list)
+    first = next(it)
+    assert paginated_list[PAGE_SIZE * 3].id == PAGE_SIZE * 3
+
+    ids = [first.id] + [item.id for item in it]
+    assert ids == list(range(PAGES * PAGE_SIZE))
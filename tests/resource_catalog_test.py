@@ -0,0 +1,145 @@
+import inspect
+import time
+from typing import Any, Callable
+from unittest.mock import Mock
+
+import pytest
+
+from pyeodh import resource_catalog as rc
+from pyeodh.types import Headers
+
+CATALOG_URL = "https://example.com/api/catalogue/stac/catalogs/cat"
+ITEM_COUNTS = {"a": 2, "b": 3, "c": 1}
+
+
+def _collection_data(collection_id: str) -> dict[str, Any]:
+    url = f"{CATALOG_URL}/collections/{collection_id}"
+    return {
+        "type": "Collection",
+        "stac_version": "1.0.0",
+        "id": collection_id,
+        "description": f"Collection {collection_id}",
+        "license": "proprietary",
+        "extent": {
+            "spatial": {"bbox": [[-180, -90, 180, 90]]},
+            "temporal": {"interval": [[None, None]]},
+        },
+        "links": [
+            {"rel": "self", "href": url},
+            {"rel": "items", "href": f"{url}/items"},
+        ],
+    }
+
+
+def _item_data(collection_id: str, index: int) -> dict[str, Any]:
+    return {
+        "type": "Feature",
+        "stac_version": "1.0.0",
+        "id": f"{collection_id}-{index}",
+        "geometry": None,
+        "properties": {"datetime": "2024-01-01T00:00:00Z"},
+        "links": [],
+        "assets": {},
+        "collection": collection_id,
+    }
+
+
+def _request_json(method, url, headers=None, params=None, data=None, cache=False):
+    path = url.removeprefix(f"{CATALOG_URL}/collections").strip("/")
+    if not path:
+        collections = [_collection_data(c) for c in ITEM_COUNTS]
+        return Headers(), {"collections": collections}
+    collection_id, _, rest = path.partition("/")
+    if rest == "items":
+        features = [
+            _item_data(collection_id, i) for i in range(ITEM_COUNTS[collection_id])
+        ]
+        return Headers(), {"features": features, "links": []}
+    return Headers(), _collection_data(collection_id)
+
+
+@pytest.fixture
+def mock_client() -> Mock:
+    client = Mock()
+    client._request_json.side_effect = _request_json
+    return client
+
+
+@pytest.fixture
+def catalog(mock_client: Mock) -> rc.Catalog:
+    data = {
+        "type": "Catalog",
+        "stac_version": "1.0.0",
+        "id": "cat",
+        "description": "Catalog",
+        "links": [{"rel": "self", "href": CATALOG_URL}],
+    }
+    return rc.Catalog(mock_client, Headers(), data)
+
+
+@pytest.mark.parametrize(
+    "method, schema",
+    [
+        (rc.Collection.update, rc._COLLECTION_SCHEMA),
+        (rc.Catalog.create_collection, rc._CREATE_COLLECTION_SCHEMA),
+        (rc.Catalog.update, rc._CATALOG_SCHEMA),
+        (rc.Catalog.search, rc._SEARCH_SCHEMA),
+        (rc.CatalogService.create_catalog, rc._CREATE_CATALOG_SCHEMA),
+        (rc.CatalogService.collection_search, rc._COLLECTION_SEARCH_SCHEMA),
+        (rc.CatalogService.discovery_search, rc._DISCOVERY_SEARCH_SCHEMA),
+    ],
+)
+def test_validation_schema_matches_signature(
+    method: Callable, schema: dict[str, type | tuple[type, ...]]
+) -> None:
+    """Tests every argument in a validation schema is a parameter of its method."""
+    assert set(schema) <= set(inspect.signature(method).parameters)
+
+
+def test_validate_args() -> None:
+    """Tests required and optional arguments are checked against the schema."""
+    schema: dict[str, type | tuple[type, ...]] = {"id": str, "query": (dict, list)}
+
+    rc._validate_args(schema, ("id",), id="a", query=None)
+    rc._validate_args(schema, ("id",), id="a", query=[])
+    with pytest.raises(AssertionError):
+        rc._validate_args(schema, ("id",), id=None, query=None)
+    with pytest.raises(AssertionError):
+        rc._validate_args(schema, ("id",), id="a", query="q")
+
+
+def test_get_all_items(monkeypatch: pytest.MonkeyPatch, catalog: rc.Catalog) -> None:
+    """Tests items of every collection are returned keyed by collection ID, without
+    a prefetch thread per worker."""
+    paginated_list = Mock(wraps=rc.PaginatedList)
+    monkeypatch.setattr(rc, "PaginatedList", paginated_list)
+
+    items = catalog.get_all_items(max_workers=2)
+
+    assert {cid: [item.id for item in items[cid]] for cid in items} == {
+        cid: [f"{cid}-{i}" for i in range(count)] for cid, count in ITEM_COUNTS.items()
+    }
+    assert paginated_list.call_count == len(ITEM_COUNTS)
+    assert not any(call.kwargs["prefetch"] for call in paginated_list.call_args_list)
+
+
+def test_get_collections_by_ids_keeps_order(
+    mock_client: Mock, catalog: rc.Catalog
+) -> None:
+    """Tests collections are returned in the order of the requested IDs even when
+    their responses arrive in a different order."""
+    delays = {"a": 0.2, "b": 0.1, "c": 0.0}
+    completed = []
+
+    def delayed_request_json(method, url, **kwargs):
+        collection_id = url.rpartition("/")[2]
+        time.sleep(delays[collection_id])
+        completed.append(collection_id)
+        return _request_json(method, url, **kwargs)
+
+    mock_client._request_json.side_effect = delayed_request_json
+
+    collections = catalog.get_collections_by_ids(["a", "b", "c"], max_workers=3)
+
+    assert completed == ["c", "b", "a"]
+    assert [c.id for c in collections] == ["a", "b", "c"]
@@ -0,0 +1,40 @@
+from typing import Callable
+
+import pytest
+
+from pyeodh.types import Link
+
+LINKS = Link.from_dicts(
+    [
+        {"rel": "self", "href": "https://example.com/a"},
+        {"rel": "next", "href": "https://example.com/a?page=2"},
+        {"rel": "self", "href": "https://example.com/b"},
+    ]
+)
+
+
+@pytest.fixture(params=[list, Link.index], ids=["list", "index"])
+def links(request) -> list[Link] | dict[str, Link]:
+    convert: Callable = request.param
+    return convert(LINKS)
+
+
+def test_get_link(links: list[Link] | dict[str, Link]) -> None:
+    """Tests get_link finds a link by rel in a list or an index."""
+    link = Link.get_link(links, "next")
+
+    assert link is not None
+    assert link.href == "https://example.com/a?page=2"
+
+
+def test_get_link_first_wins(links: list[Link] | dict[str, Link]) -> None:
+    """Tests the first of several links with the same rel is returned."""
+    link = Link.get_link(links, "self")
+
+    assert link is not None
+    assert link.href == "https://example.com/a"
+
+
+def test_get_link_missing(links: list[Link] | dict[str, Link]) -> None:
+    """Tests get_link returns None when no link has the rel."""
+    assert Link.get_link(links, "prev") is None
@@ -0,0 +1,55 @@
+import posixpath
+
+import pytest
+
+from pyeodh.utils import is_absolute_url, join_url
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        ("https://example.com",),
+        ("https://example.com", "a"),
+        ("https://example.com/", "a"),
+        ("https://example.com", "a", "b"),
+        ("https://example.com", "vs/cache/ows/wmts/"),
+        ("https://example.com/", "vs/cache/ows"),
+        ("https://example.com", "_mgmt/ping"),
+        ("a", "b/", "c"),
+        ("a", "", "b"),
+        ("a", "b", ""),
+        ("", "a"),
+        ("", "", "a"),
+        ("/", "a"),
+        tuple(f"s{i}" for i in range(20)),
+    ],
+)
+def test_join_url_matches_posixpath(args: tuple[str, ...]) -> None:
+    """Tests join_url gives the same results as posixpath.join."""
+    assert join_url(*args) == posixpath.join(*args)
+
+
+@pytest.mark.parametrize("args", [("a", "/b"), ("https://example.com", "b", "/c")])
+def test_join_url_absolute_path(args: tuple[str, ...]) -> None:
+    """Tests only the first argument of join_url can be an absolute path."""
+    with pytest.raises(ValueError):
+        join_url(*args)
+
+
+@pytest.mark.parametrize(
+    "url, expected",
+    [
+        ("http://example.com", True),
+        ("https://example.com/a", True),
+        ("HTTPS://example.com", True),
+        ("Http://example.com", True),
+        ("/api/catalogue", False),
+        ("api/catalogue", False),
+        ("", False),
+        ("//example.com/path", False),
+        ("ftp://example.com", False),
+    ],
+)
+def test_is_absolute_url(url: str, expected: bool) -> None:
+    """Tests only http(s) URLs, in any case, are treated as absolute."""
+    assert is_absolute_url(url) is expected